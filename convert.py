@@ -1,12 +1,19 @@
 from src.model_conversion import convert_model
 from src.config import Config as Cfg
+from src.model import get_input_size
 
 
 # Define model path
 # model_path = f'./models/cifar-10/{Cfg.MODEL_TYPE}'
 model_path = f'{Cfg.MODEL_PATH}/best'
 
-# Convert and save model to 'TFLite' or 'onnx'
-output_model_directory = convert_model(model_directory=model_path, output_type='TFLite')
+# Get model input shape for the calibration images
+input_shape = get_input_size()
+
+# Convert and save model to 'TFLite', 'TensorRT', or 'onnx'
+output_model_directory = convert_model(model_directory=model_path, output_type='TFLite',
+                                       input_shape=input_shape, quantization=Cfg.TFLITE_QUANTIZATION,
+                                       precision_mode=Cfg.TENSORRT_PRECISION_MODE,
+                                       argmax_output=Cfg.TFLITE_ARGMAX_OUTPUT)
 
 print(f'Model saved in {output_model_directory} directory')
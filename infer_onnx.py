@@ -18,9 +18,6 @@ input_shape = tuple(ort_sess.get_inputs()[0].shape[1:3])
 images_path = ['./samples/11.png']
 images = Uf.load_images(images_path=images_path, input_shape=input_shape)
 
-# Convert float64 to float32
-images = images.astype('float32')
-
 # Infer on a sample image
 input_name = ort_sess.get_inputs()[0].name
 output = ort_sess.run(None, {input_name: images})
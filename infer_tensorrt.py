@@ -0,0 +1,31 @@
+import tensorflow as tf
+
+from src.utils import UtilityFunction as Uf
+from src.model import get_input_size
+from src.config import Config as Cfg
+
+
+# Define model path
+model_path = f'{Cfg.MODEL_PATH}/best.tensorrt'
+
+# Load TensorRT model
+model = tf.saved_model.load(model_path)
+infer = model.signatures['serving_default']
+
+# Get input shape
+input_shape = get_input_size()
+
+# Load images
+images_path = ['./samples/11.png', './samples/17.png']
+images = Uf.load_images(images_path=images_path, input_shape=input_shape)
+
+# Infer on the images
+outputs = infer(tf.constant(images))
+
+# GoogLeNet and Inception models name their main output layer 'output'. Other models have one output.
+predictions = outputs['output'] if 'output' in outputs else list(outputs.values())[0]
+
+# Convert outputs to corresponding labels
+labels = Uf.get_predictions_label(predictions=predictions.numpy())
+
+print(f'The predicted labels are {labels}')
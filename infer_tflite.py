@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 import tflite_runtime.interpreter as tflite
 import numpy as np
+import os
 
 from src.utils import UtilityFunction as Uf
 from src.config import Config as Cfg
@@ -8,8 +10,16 @@ from src.config import Config as Cfg
 # Define model path
 model_path = f'./models/cifar-10/{Cfg.MODEL_TYPE}.tflite'
 
-# Load TFLite model and allocate tensors
-interpreter = tflite.Interpreter(model_path=model_path)
+# Run the model on GPU if the GPU delegate is enabled
+experimental_delegates = None
+if Cfg.TFLITE_USE_GPU_DELEGATE:
+    experimental_delegates = [tflite.load_delegate(library=Cfg.TFLITE_GPU_DELEGATE_PATH,
+                                                   options=Cfg.TFLITE_GPU_DELEGATE_OPTIONS)]
+
+# Load TFLite model and allocate tensors. Without GPU delegate, the prebuilt tflite-runtime applies
+# the XNNPACK delegate by default, which runs the convolutions on as many threads as num_threads.
+interpreter = tflite.Interpreter(model_path=model_path, num_threads=os.cpu_count(),
+                                 experimental_delegates=experimental_delegates)
 interpreter.allocate_tensors()
 
 # Get input and output tensors
@@ -19,20 +29,68 @@ output_details = interpreter.get_output_details()
 # Get input shape
 input_shape = tuple(input_details[0]['shape'][1:3])
 
-# Load images
-images_path = ['./samples/17.png']
-images = Uf.load_images(images_path=images_path, input_shape=input_shape)
+# Define images path
+images_path = ['./samples/11.png', './samples/17.png']
+
+# Resize the input tensor once, so that each invoke infers on a batch of images
+batch_size = min(Cfg.TFLITE_BATCH_SIZE, len(images_path))
+interpreter.resize_tensor_input(input_details[0]['index'], [batch_size, input_shape[0], input_shape[1], 3])
+interpreter.allocate_tensors()
+
+
+def load_batch(batch_images_path):
+    """
+    Load a batch of images for the input tensor. The batch is padded to the batch size of the input tensor
+    and quantized for int8 models.
+    :param batch_images_path: path of the images in the batch
+    :return:
+    """
+
+    images = Uf.load_images(images_path=batch_images_path, input_shape=input_shape)
+
+    # Pad the last batch to the batch size of the input tensor
+    images_number = len(images)
+    images = np.pad(images, ((0, batch_size - images_number), (0, 0), (0, 0), (0, 0)))
+
+    # Quantize images for int8 models
+    if input_details[0]['dtype'] == np.int8:
+        input_scale, input_zero_point = input_details[0]['quantization']
+        images = np.clip(np.round(images / input_scale + input_zero_point), -128, 127).astype(np.int8)
+
+    return images, images_number
+
+
+batches_path = [images_path[batch_start:batch_start + batch_size]
+                for batch_start in range(0, len(images_path), batch_size)]
+
+labels = []
+with ThreadPoolExecutor(max_workers=1) as executor:
+    next_batch = executor.submit(load_batch, batches_path[0])
+
+    for batch_index in range(len(batches_path)):
+        images, images_number = next_batch.result()
+
+        # Load the next batch in the background while the interpreter infers on the current batch
+        if batch_index + 1 < len(batches_path):
+            next_batch = executor.submit(load_batch, batches_path[batch_index + 1])
+
+        # Infer on a batch of images
+        interpreter.set_tensor(input_details[0]['index'], images)
+        interpreter.invoke()
 
-# Convert float64 to float32
-images = images.astype('float32')
+        output_data = interpreter.get_tensor(output_details[0]['index'])[:images_number]
 
-# Infer on a sample image
-interpreter.set_tensor(input_details[0]['index'], images)
-interpreter.invoke()
+        # Models converted with argmax output give the class number of each image
+        if output_details[0]['dtype'] == np.int32:
+            labels.extend([Cfg.CIFAR_10_CLASS_NAMES[class_number] for class_number in output_data])
+            continue
 
-output_data = interpreter.get_tensor(output_details[0]['index'])
+        # Dequantize output of int8 models
+        if output_details[0]['dtype'] == np.int8:
+            output_scale, output_zero_point = output_details[0]['quantization']
+            output_data = (output_data.astype('float32') - output_zero_point) * output_scale
 
-# Convert output to corresponding label
-label = Cfg.CIFAR_10_CLASS_NAMES[np.argmax(output_data[0])]
+        # Convert outputs to corresponding labels
+        labels.extend(Uf.get_predictions_label(predictions=output_data))
 
-print(f'The predicted labels is {label}')
+print(f'The predicted labels are {labels}')
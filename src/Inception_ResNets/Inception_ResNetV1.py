@@ -326,7 +326,7 @@ class InceptionResNetV1:
         # Classifier part
         X = Flatten()(X)
         X = Dropout(rate=0.2)(X)
-        X_output = Dense(units=self.classes, activation='softmax', name='output',
+        X_output = Dense(units=self.classes, activation='softmax', dtype='float32', name='output',
                          kernel_initializer=random_uniform)(X)
 
         # Create model
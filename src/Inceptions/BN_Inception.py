@@ -195,7 +195,7 @@ class BNInception:
         X_dropout = Dropout(rate=0.7)(X_fc)
 
         # Auxiliary output layer
-        X_aux_output = Dense(units=self.classes, activation='softmax', name=output_name,
+        X_aux_output = Dense(units=self.classes, activation='softmax', dtype='float32', name=output_name,
                              kernel_initializer=random_uniform())(X_dropout)
 
         return X_aux_output
@@ -283,7 +283,7 @@ class BNInception:
         X = Dense(units=1000, activation='relu', kernel_initializer=random_uniform())(X)
 
         # Layer 20
-        output = Dense(units=self.classes, activation='softmax', name='output',
+        output = Dense(units=self.classes, activation='softmax', dtype='float32', name='output',
                        kernel_initializer=random_uniform())(X)
 
         # Create model
@@ -1,5 +1,5 @@
 from tensorflow.keras.layers import Conv2D, MaxPooling2D, Dropout, Activation, \
-    Flatten, Dense, Input, AveragePooling2D, concatenate, BatchNormalization
+    Flatten, Dense, Input, AveragePooling2D, Concatenate, BatchNormalization
 from tensorflow.keras.models import Model
 from tensorflow.keras.initializers import random_uniform
 
@@ -10,47 +10,55 @@ class GoogLeNet:
         self.input_shape = input_shape
         self.classes = classes
 
-    @staticmethod
-    def __naive_inception_block(X, filters, kernel_size=((1, 1), (3, 3), (5, 5)), pool_size=(3, 3),
-                                initializer=random_uniform):
+        # Initializer class of the layers. Each layer calls it to create its own initializer instance.
+        self.initializer = random_uniform
+
+    def __conv_block(self, X, filters, kernel_size, strides=(1, 1), padding='same'):
+        """
+        This method creates a convolution block. This block consist of conv, batch normalization and relu layers.
+        :param X: input layer
+        :param filters: number of filters
+        :param kernel_size: kernel size of conv layer
+        :param strides: size of stride
+        :param padding: padding of conv layer
+        :return:
+        """
+
+        X_conv = Conv2D(filters=filters, kernel_size=kernel_size, strides=strides, padding=padding,
+                        use_bias=False, kernel_initializer=self.initializer())(X)
+        X_conv = BatchNormalization()(X_conv)
+        X_conv = Activation('relu')(X_conv)
+
+        return X_conv
+
+    def __naive_inception_block(self, X, filters, kernel_size=((1, 1), (3, 3), (5, 5)), pool_size=(3, 3)):
         """
         This method creates the naive inception block.
         :param X: input layer
         :param filters: list of filters size
         :param kernel_size: list of kernel_size
         :param pool_size: pool size of max pooling layer
-        :param initializer: to set up the initial weights of a layer. Equals to random uniform initializer
         :return:
         """
 
         filters_1by1, filters_3by3, filters_5by5 = filters
         kernel_size_1by1, kernel_size_3by3, kernel_size_5by5 = kernel_size
 
-        X_1by1 = Conv2D(filters=filters_1by1, kernel_size=kernel_size_1by1, strides=(1, 1),
-                        padding='valid', kernel_initializer=initializer())(X)
-        X_1by1 = BatchNormalization()(X_1by1)
-        X_1by1 = Activation('relu')(X_1by1)
+        X_1by1 = self.__conv_block(X=X, filters=filters_1by1, kernel_size=kernel_size_1by1)
 
-        X_3by3 = Conv2D(filters=filters_3by3, kernel_size=kernel_size_3by3, strides=(1, 1),
-                        padding='valid', kernel_initializer=initializer())(X)
-        X_3by3 = BatchNormalization()(X_3by3)
-        X_3by3 = Activation('relu')(X_3by3)
+        X_3by3 = self.__conv_block(X=X, filters=filters_3by3, kernel_size=kernel_size_3by3)
 
-        X_5by5 = Conv2D(filters=filters_5by5, kernel_size=kernel_size_5by5, strides=(1, 1),
-                        padding='valid', kernel_initializer=initializer())(X)
-        X_5by5 = BatchNormalization()(X_5by5)
-        X_5by5 = Activation('relu')(X_5by5)
+        X_5by5 = self.__conv_block(X=X, filters=filters_5by5, kernel_size=kernel_size_5by5)
 
         X_max_pooling = MaxPooling2D(pool_size=pool_size, strides=(1, 1), padding='same')(X)
 
-        X_concat = concatenate(inputs=[X_1by1, X_3by3, X_5by5, X_max_pooling], axis=0)
+        X_concat = Concatenate(axis=-1)([X_1by1, X_3by3, X_5by5, X_max_pooling])
         X_concat = Activation('relu')(X_concat)
 
         return X_concat
 
-    @staticmethod
-    def __inception_block(X, filters, reduced_filters, kernel_size=((1, 1), (3, 3), (5, 5)), pool_size=(3, 3),
-                          initializer=random_uniform):
+    def __inception_block(self, X, filters, reduced_filters, kernel_size=((1, 1), (3, 3), (5, 5)),
+                          pool_size=(3, 3)):
         """
         This method creates the inception block.
         :param X: input layer
@@ -58,7 +66,6 @@ class GoogLeNet:
         :param reduced_filters: list of 1x1 filters for dimensionality reduction
         :param kernel_size: list of kernel_size
         :param pool_size: pool size of max pooling layer
-        :param initializer: to set up the initial weights of a layer. Equals to random uniform initializer
         :return:
         """
 
@@ -67,53 +74,31 @@ class GoogLeNet:
         kernel_size_1by1, kernel_size_3by3, kernel_size_5by5 = kernel_size
 
         # 1x1 layer
-        X_1by1 = Conv2D(filters=filters_1by1, kernel_size=kernel_size_1by1, strides=(1, 1),
-                        padding='same', kernel_initializer=initializer())(X)
-        X_1by1 = BatchNormalization()(X_1by1)
-        X_1by1 = Activation('relu')(X_1by1)
+        X_1by1 = self.__conv_block(X=X, filters=filters_1by1, kernel_size=kernel_size_1by1)
 
         # 3x3 layer
-        X_reduced_3by3 = Conv2D(filters=reduced_filters_3by3, kernel_size=(1, 1), strides=(1, 1),
-                                padding='same', kernel_initializer=initializer())(X)
-        X_reduced_3by3 = BatchNormalization()(X_reduced_3by3)
-        X_reduced_3by3 = Activation('relu')(X_reduced_3by3)
-
-        X_3by3 = Conv2D(filters=filters_3by3, kernel_size=kernel_size_3by3, strides=(1, 1),
-                        padding='same', kernel_initializer=initializer())(X_reduced_3by3)
-        X_3by3 = BatchNormalization()(X_3by3)
-        X_3by3 = Activation('relu')(X_3by3)
+        X_reduced_3by3 = self.__conv_block(X=X, filters=reduced_filters_3by3, kernel_size=(1, 1))
+        X_3by3 = self.__conv_block(X=X_reduced_3by3, filters=filters_3by3, kernel_size=kernel_size_3by3)
 
         # 5x5 layer
-        X_reduced_5by5 = Conv2D(filters=reduced_filters_5by5, kernel_size=(1, 1), strides=(1, 1),
-                                padding='same', kernel_initializer=initializer())(X)
-        X_reduced_5by5 = BatchNormalization()(X_reduced_5by5)
-        X_reduced_5by5 = Activation('relu')(X_reduced_5by5)
-
-        X_5by5 = Conv2D(filters=filters_5by5, kernel_size=kernel_size_5by5, strides=(1, 1),
-                        padding='same', kernel_initializer=initializer())(X_reduced_5by5)
-        X_5by5 = BatchNormalization()(X_5by5)
-        X_5by5 = Activation('relu')(X_5by5)
+        X_reduced_5by5 = self.__conv_block(X=X, filters=reduced_filters_5by5, kernel_size=(1, 1))
+        X_5by5 = self.__conv_block(X=X_reduced_5by5, filters=filters_5by5, kernel_size=kernel_size_5by5)
 
         # max pooling layer
         X_max_pooling = MaxPooling2D(pool_size=pool_size, strides=(1, 1), padding='same')(X)
-        X_reduced_5by5 = Conv2D(filters=pool_projection, kernel_size=(1, 1), strides=(1, 1),
-                                activation='relu', padding='same',
-                                kernel_initializer=initializer())(X_max_pooling)
-        X_reduced_5by5 = BatchNormalization()(X_reduced_5by5)
-        X_reduced_5by5 = Activation('relu')(X_reduced_5by5)
+        X_pool_projection = self.__conv_block(X=X_max_pooling, filters=pool_projection, kernel_size=(1, 1))
 
         # concatenate layers
-        X_concat = concatenate(inputs=[X_1by1, X_3by3, X_5by5, X_reduced_5by5])
+        X_concat = Concatenate(axis=-1)([X_1by1, X_3by3, X_5by5, X_pool_projection])
         X_concat = Activation('relu')(X_concat)
 
         return X_concat
 
-    def __auxiliary_classifier(self, X, output_name, initializer=random_uniform):
+    def __auxiliary_classifier(self, X, output_name):
         """
         This method creates an auxiliary classifier.
         :param X: input layer
         :param output_name: name of output layer
-        :param initializer: to set up the initial weights of a layer. Equals to random uniform initializer
         :return:
         """
 
@@ -121,23 +106,20 @@ class GoogLeNet:
         X_average_pool = AveragePooling2D(pool_size=(5, 5), strides=(3, 3), padding='valid')(X)
 
         # Convolution layer for dimensionality reduction
-        X_conv = Conv2D(filters=128, kernel_size=(1, 1), strides=(1, 1), padding='same',
-                        kernel_initializer=initializer())(X_average_pool)
-        X_conv = BatchNormalization()(X_conv)
-        X_conv = Activation('relu')(X_conv)
+        X_conv = self.__conv_block(X=X_average_pool, filters=128, kernel_size=(1, 1))
 
         # Flatten layer
         X_flatten = Flatten()(X_conv)
 
         # FC layer
-        X_fc = Dense(units=1024, activation='relu', kernel_initializer=random_uniform())(X_flatten)
+        X_fc = Dense(units=1024, activation='relu', kernel_initializer=self.initializer())(X_flatten)
 
         # Dropout layer
         X_dropout = Dropout(rate=0.7)(X_fc)
 
         # Auxiliary output layer
-        X_aux_output = Dense(units=self.classes, activation='softmax', name=output_name,
-                             kernel_initializer=random_uniform())(X_dropout)
+        X_aux_output = Dense(units=self.classes, activation='softmax', dtype='float32', name=output_name,
+                             kernel_initializer=self.initializer())(X_dropout)
 
         return X_aux_output
 
@@ -150,25 +132,16 @@ class GoogLeNet:
         X_input = Input((self.input_shape[0], self.input_shape[1], 3))
 
         # Layer 1
-        X = Conv2D(filters=64, kernel_size=(7, 7), strides=(2, 2), padding='same',
-                   kernel_initializer=random_uniform)(X_input)
-        X = BatchNormalization()(X)
-        X = Activation('relu')(X)
+        X = self.__conv_block(X=X_input, filters=64, kernel_size=(7, 7), strides=(2, 2))
 
         # Layer 2
         X = MaxPooling2D(pool_size=(3, 3), strides=(2, 2), padding='same')(X)
 
         # Layer 3
-        X = Conv2D(filters=64, kernel_size=(1, 1), strides=(1, 1), padding='valid',
-                   kernel_initializer=random_uniform)(X)
-        X = BatchNormalization()(X)
-        X = Activation('relu')(X)
+        X = self.__conv_block(X=X, filters=64, kernel_size=(1, 1), padding='valid')
 
         # Layer 4
-        X = Conv2D(filters=192, kernel_size=(3, 3), strides=(1, 1), padding='same',
-                   kernel_initializer=random_uniform)(X)
-        X = BatchNormalization()(X)
-        X = Activation('relu')(X)
+        X = self.__conv_block(X=X, filters=192, kernel_size=(3, 3))
 
         # Layer 5
         X = MaxPooling2D(pool_size=(3, 3), strides=(2, 2), padding='same')(X)
@@ -220,11 +193,11 @@ class GoogLeNet:
         X = Dropout(rate=0.4)(X)
 
         # Layer 19
-        X = Dense(units=1000, activation='relu', kernel_initializer=random_uniform())(X)
+        X = Dense(units=1000, activation='relu', kernel_initializer=self.initializer())(X)
 
         # Layer 20
-        output = Dense(units=self.classes, activation='softmax', name='output',
-                       kernel_initializer=random_uniform())(X)
+        output = Dense(units=self.classes, activation='softmax', dtype='float32', name='output',
+                       kernel_initializer=self.initializer())(X)
 
         # Create model
         model = Model(inputs=X_input, outputs=[output, X_aux_1, X_aux_2])
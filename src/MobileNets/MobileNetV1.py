@@ -94,7 +94,7 @@ class MobileNetV1:
 
         # Output layer
         X = Flatten()(X)
-        X = Dense(self.classes, activation='softmax')(X)
+        X = Dense(self.classes, activation='softmax', dtype='float32')(X)
 
         # Create model
         model = Model(inputs=X_input, outputs=X)
@@ -125,7 +125,7 @@ class MobileNetV2:
 
         # Layer 21
         X = Flatten()(X)
-        X = Dense(self.class_numbers, activation='softmax')(X)
+        X = Dense(self.class_numbers, activation='softmax', dtype='float32')(X)
 
         # Create model
         model = Model(inputs=X_input, outputs=X)
@@ -151,7 +151,8 @@ class ResNet50:
 
         # Output layer
         X = Flatten()(X)
-        X = Dense(self.classes, activation='softmax', kernel_initializer=glorot_uniform(seed=0))(X)
+        X = Dense(self.classes, activation='softmax', dtype='float32',
+                  kernel_initializer=glorot_uniform(seed=0))(X)
 
         # Create model
         model = Model(inputs=X_input, outputs=X)
@@ -92,7 +92,8 @@ class VGG16:
         X = Dense(units=4096, activation='relu', kernel_initializer=glorot_uniform())(X)
         X = Dropout(rate=0.5)(X)
 
-        X_output = Dense(units=self.classes, activation='softmax', kernel_initializer=glorot_uniform())(X)
+        X_output = Dense(units=self.classes, activation='softmax', dtype='float32',
+                         kernel_initializer=glorot_uniform())(X)
 
         model = Model(inputs=X_input, outputs=X_output)
 
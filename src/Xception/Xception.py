@@ -166,7 +166,8 @@ class Xception:
         X = Flatten()(X)
         X = Dense(units=2048, activation='relu', kernel_initializer=random_uniform)(X)
 
-        X_output = Dense(units=self.class_numbers, activation='softmax', kernel_initializer=random_uniform)(X)
+        X_output = Dense(units=self.class_numbers, activation='softmax', dtype='float32',
+                         kernel_initializer=random_uniform)(X)
 
         model = Model(inputs=X_input, outputs=X_output)
 
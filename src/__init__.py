@@ -0,0 +1,5 @@
+import os
+
+# Let oneDNN reorder the Conv2D tensors into blocked (nChw8c/nChw16c) layouts on CPU.
+# It must be set before tensorflow is imported, so it is set when the src package is imported.
+os.environ.setdefault('TF_ENABLE_ONEDNN_OPTS', '1')
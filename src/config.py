@@ -17,7 +17,7 @@ class Config:
     INCEPTION_RESNET_V2_INPUT_SIZE = (299, 299)
 
     # 'MobileNetV1', 'MobileNetV2', 'ResNet50', 'GoogLeNet', 'VGG16', 'VGG13', 'VGG11', 'BNInception'
-    # 'InceptionV3', 'InceptionV4', 'Xception', 'Inception-ResNetV1', 'Inception-ResNetV2'
+    # 'InceptionV4', 'Xception', 'Inception-ResNetV1', 'Inception-ResNetV2'
     MODEL_TYPE = 'MobileNetV1'
 
     MODEL_PATH = f'models/cifar-10/{MODEL_TYPE}'
@@ -27,6 +27,10 @@ class Config:
     BATCH_SIZE = 32
     # Each model trains for 300 epochs
     EPOCHS = 100
+    # None, 'mixed_float16' (GPU), 'mixed_bfloat16' (TPU)
+    MIXED_PRECISION_POLICY = None
+    # Compile the GoogLeNet train and eval steps with XLA
+    XLA_JIT_COMPILE = True
 
     TRAIN_SUBSET = 0.8
     VALIDATION_SUBSET = 1 - TRAIN_SUBSET
@@ -34,6 +38,28 @@ class Config:
     TRAIN_DATASET_PATH = 'dataset/cifar-10/images/train'
     TEST_DATASET_PATH = 'dataset/cifar-10/images/test'
 
+    # Conversion config
+    # None, 'int8', 'float16'
+    TFLITE_QUANTIZATION = 'int8'
+    # Number of train images used to calibrate the quantized model
+    REPRESENTATIVE_SAMPLES = 100
+    # Compute argmax in the TFLite model, so that it outputs the class number instead of class probabilities
+    TFLITE_ARGMAX_OUTPUT = True
+    # 'FP32', 'FP16', 'INT8'
+    TENSORRT_PRECISION_MODE = 'FP16'
+
+    # TFLite inference config
+    # Run the TFLite model on GPU. Use it with 'float16' or None quantization.
+    TFLITE_USE_GPU_DELEGATE = False
+    TFLITE_GPU_DELEGATE_PATH = 'libtensorflowlite_gpu_delegate.so'
+    # Options passed to the GPU delegate. 'precision_loss_allowed' lets the delegate compute in float16, which is
+    # needed to get the float16 speedup on GPU. 'inference_preference' 1 asks for sustained speed, so the delegate
+    # builds its command buffers once and reuses them for every invoke. Change the keys if your delegate build does
+    # not accept them.
+    TFLITE_GPU_DELEGATE_OPTIONS = {'precision_loss_allowed': '1', 'inference_preference': '1'}
+    # Number of images in each invoke of the TFLite interpreter
+    TFLITE_BATCH_SIZE = 32
+
     # Dataset configs
     CIFAR_10_CLASS_NAMES = ['airplane', 'automobile', 'bird', 'cat', 'deer', 'dog', 'frog',
                             'horse', 'ship', 'truck']
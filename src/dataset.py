@@ -166,21 +166,25 @@ def prepare_dataset(image_list, label_list, is_train=True):
     slices_dataset = tf.data.Dataset.from_tensor_slices(image_filenames)
     slices_labels = tf.data.Dataset.from_tensor_slices(label_list)
 
+    # Decode and augment images in parallel. The order of images is kept, so they still match the labels.
     if is_train:
-        image_dataset = slices_dataset.map(map_func=process_image).\
-            map(lambda image: tf.image.stateless_random_flip_left_right(image=image, seed=(2, 5))).\
-            map(lambda image: tf.image.stateless_random_flip_up_down(image=image, seed=(10, 11)))
+        image_dataset = slices_dataset.map(map_func=process_image, num_parallel_calls=tf.data.AUTOTUNE).\
+            map(lambda image: tf.image.stateless_random_flip_left_right(image=image, seed=(2, 5)),
+                num_parallel_calls=tf.data.AUTOTUNE).\
+            map(lambda image: tf.image.stateless_random_flip_up_down(image=image, seed=(10, 11)),
+                num_parallel_calls=tf.data.AUTOTUNE)
     else:
-        image_dataset = slices_dataset.map(map_func=process_image)
+        image_dataset = slices_dataset.map(map_func=process_image, num_parallel_calls=tf.data.AUTOTUNE)
 
-    label_dataset = slices_labels.map(map_func=process_label)
+    label_dataset = slices_labels.map(map_func=process_label, num_parallel_calls=tf.data.AUTOTUNE)
 
     x_dataset = image_dataset.shuffle(buffer_size=Cfg.BUFFER_SIZE, seed=0).\
         batch(batch_size=Cfg.BATCH_SIZE)
     y_dataset = label_dataset.shuffle(buffer_size=Cfg.BUFFER_SIZE, seed=0).\
         batch(batch_size=Cfg.BATCH_SIZE)
 
-    dataset = tf.data.Dataset.zip((x_dataset, y_dataset))
+    # Prepare the next batches on CPU while the model trains on the current batch
+    dataset = tf.data.Dataset.zip((x_dataset, y_dataset)).prefetch(buffer_size=tf.data.AUTOTUNE)
 
     return dataset
 
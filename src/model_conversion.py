@@ -1,18 +1,106 @@
 import tensorflow as tf
+import numpy as np
+import os
 
+from src.utils import UtilityFunction as Uf
+from src.config import Config as Cfg
 
-def convert_to_tflite(model_directory):
+
+def get_representative_dataset(input_shape, samples_number):
+    """
+    Create a representative dataset from random train images to calibrate the quantized model.
+    :param input_shape: model input shape
+    :param samples_number: number of images used for calibration
+    """
+
+    directory = f'./{Cfg.TRAIN_DATASET_PATH}'
+
+    images_list = [f'{directory}/{folder}/{image_path}'
+                   for folder in sorted(os.listdir(directory))
+                   for image_path in sorted(os.listdir(f'{directory}/{folder}'))]
+
+    # Seeded sampling, so that the calibration images are the same in every conversion
+    images_list = np.random.default_rng(seed=0).permutation(images_list)[:samples_number]
+
+    def representative_dataset():
+        for image_path in images_list:
+            image = Uf.load_images(images_path=[image_path], input_shape=input_shape)
+
+            yield [image]
+
+    return representative_dataset
+
+
+def add_argmax_output(model):
+    """
+    Add an argmax layer on the main output of the model, so that the model outputs the class number of each
+    image instead of the class probabilities. Auxiliary outputs are removed.
+    :param model: keras model
+    """
+
+    labels = tf.keras.layers.Lambda(lambda x: tf.argmax(x, axis=-1, output_type=tf.int32),
+                                    name='label')(model.outputs[0])
+
+    argmax_model = tf.keras.models.Model(inputs=model.inputs, outputs=labels)
+
+    return argmax_model
+
+
+def convert_to_tflite(model_directory, quantization=None, representative_dataset=None, argmax_output=False):
     """
     Convert the model in model_path to TFLite.
     :param model_directory: directory of the saved model
+    :param quantization: post-training quantization type. None, 'int8', or 'float16'
+    :param representative_dataset: generator of calibration samples. Required for 'int8' quantization
+    :param argmax_output: if True, the TFLite model outputs the int32 class number of each image
     """
 
-    converter = tf.lite.TFLiteConverter.from_saved_model(model_directory)
+    if argmax_output:
+        model = add_argmax_output(model=tf.keras.models.load_model(model_directory))
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    else:
+        converter = tf.lite.TFLiteConverter.from_saved_model(model_directory)
+
+    if quantization == 'int8':
+        # Full integer quantization. Inputs and outputs are quantized too, except the int32 argmax output.
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        if not argmax_output:
+            converter.inference_output_type = tf.int8
+
+    elif quantization == 'float16':
+        # Float16 weights. Inputs and outputs stay float32.
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+
+    elif quantization is not None:
+        raise Exception(f'Invalid quantization type! Can not quantize model to {quantization}.')
+
     tflite_model = converter.convert()
 
     return tflite_model
 
 
+def convert_to_tensorrt(model_directory, output_model_directory, precision_mode='FP16',
+                        calibration_input_fn=None):
+    """
+    Convert the model in model_directory to a TensorRT optimized saved model. TensorRT picks the fastest
+    kernels (e.g. Winograd for 3x3 convs) and fuses the convolutions with their bias and activation.
+    :param model_directory: directory of the saved model
+    :param output_model_directory: directory to save the converted model
+    :param precision_mode: precision of the TensorRT engines. 'FP32', 'FP16', or 'INT8'
+    :param calibration_input_fn: generator of calibration samples. Required for 'INT8' precision
+    """
+
+    converter = tf.experimental.tensorrt.Converter(input_saved_model_dir=model_directory,
+                                                   precision_mode=precision_mode,
+                                                   use_calibration=precision_mode == 'INT8')
+    converter.convert(calibration_input_fn=calibration_input_fn)
+    converter.save(output_saved_model_dir=output_model_directory)
+
+
 def save_tflite_model(tflite_model, tflite_model_directory):
     """
     Save the converted TFLite model.
@@ -28,7 +116,7 @@ def get_output_model_directory(model_directory, output_type):
     """
     Get the output directory to save the converted model.
     :param model_directory: directory of the saved model
-    :param output_type: model type conversion. 'TFLite' or 'onnx'
+    :param output_type: model type conversion. 'TFLite', 'TensorRT', or 'onnx'
     """
 
     model_name = model_directory.split('/')[-1]
@@ -37,20 +125,43 @@ def get_output_model_directory(model_directory, output_type):
     return output_model_directory
 
 
-def convert_model(model_directory, output_type):
+def convert_model(model_directory, output_type, input_shape=None, quantization=None, precision_mode='FP16',
+                  argmax_output=False):
     """
     Convert the model to output_type.
     :param model_directory: directory of the saved model
-    :param output_type: model type conversion. 'TFLite' or 'onnx'
+    :param output_type: model type conversion. 'TFLite', 'TensorRT', or 'onnx'
+    :param input_shape: model input shape. Required for 'int8' quantization and 'INT8' precision
+    :param quantization: post-training quantization type of TFLite model. None, 'int8', or 'float16'
+    :param precision_mode: precision of TensorRT model. 'FP32', 'FP16', or 'INT8'
+    :param argmax_output: if True, the TFLite model outputs the class number of each image
     """
 
     output_model_directory = get_output_model_directory(model_directory=model_directory,
                                                         output_type=output_type)
 
     if output_type == 'TFLite':
-        converted_model = convert_to_tflite(model_directory=model_directory)
+        representative_dataset = None
+
+        if quantization == 'int8':
+            representative_dataset = get_representative_dataset(input_shape=input_shape,
+                                                                samples_number=Cfg.REPRESENTATIVE_SAMPLES)
+
+        converted_model = convert_to_tflite(model_directory=model_directory, quantization=quantization,
+                                            representative_dataset=representative_dataset,
+                                            argmax_output=argmax_output)
         save_tflite_model(tflite_model=converted_model, tflite_model_directory=output_model_directory)
 
+    elif output_type == 'TensorRT':
+        calibration_input_fn = None
+
+        if precision_mode == 'INT8':
+            calibration_input_fn = get_representative_dataset(input_shape=input_shape,
+                                                              samples_number=Cfg.REPRESENTATIVE_SAMPLES)
+
+        convert_to_tensorrt(model_directory=model_directory, output_model_directory=output_model_directory,
+                            precision_mode=precision_mode, calibration_input_fn=calibration_input_fn)
+
     elif output_type == 'onnx':
         pass
 
@@ -58,4 +169,3 @@ def convert_model(model_directory, output_type):
         raise Exception(f'Invalid conversion type! Can not convert model to {output_type}.')
 
     return output_model_directory
-
@@ -34,12 +34,13 @@ class UtilityFunction:
         :param input_shape: model input shape
         """
 
-        images = [cv2.cvtColor(cv2.imread(image_path), cv2.COLOR_BGR2RGB) / 255
+        images = [cv2.resize(cv2.cvtColor(cv2.imread(image_path), cv2.COLOR_BGR2RGB), dsize=input_shape)
                   for image_path in images_path]
 
-        images = [cv2.resize(image, dsize=input_shape) for image in images]
+        # Rescale the resized uint8 images at once in float32, like the train data generators do
+        images = np.array(images, dtype=np.float32) / 255
 
-        return np.array(images)
+        return images
 
     @staticmethod
     def get_predictions_label(predictions):